@@ -1,12 +1,21 @@
+import asyncio
+import contextlib
+import email.utils
+import functools
 import os
-from datetime import datetime, timedelta
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import pickle
 
-import requests
+import httpx
+import orjson
 from dotenv import load_dotenv
 from openai import OpenAI
 
+from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from google.auth.transport.requests import Request
@@ -15,57 +24,191 @@ from google.auth.transport.requests import Request
 
 # ---------------- ENV + CONFIG ----------------
 
-# Load environment variables from .env
-load_dotenv()
+# Nothing here runs at import time: .env is read and the OpenAI client is
+# created the first time they are actually needed.
+
+@functools.lru_cache(maxsize=1)
+def _load_env():
+    """Load environment variables from .env (once per process)."""
+    load_dotenv()
+
+
+def _get_env(name, default=None):
+    _load_env()
+    return os.getenv(name, default)
+
 
 # API keys and config from .env
-NYT_KEY = os.getenv("NYT_API_KEY")
-WEATHER_KEY = os.getenv("WEATHER_API_KEY")
-LAT = os.getenv("HOME_LAT")
-LON = os.getenv("HOME_LON")
-OPENAI_API_KEY = os.getenv ("OpenAI_API_KEY")
+@functools.lru_cache(maxsize=1)
+def _nyt_key():
+    return _get_env("NYT_API_KEY")
+
 
+@functools.lru_cache(maxsize=1)
+def _weather_key():
+    return _get_env("WEATHER_API_KEY")
 
-# Folder where credentials.json and token_*.pkl live
-SECRET_DIR = Path(os.getenv("AGENTPARK_SECRET_DIR", "")).expanduser()
-credentials_path = SECRET_DIR /  "credentials.json"
+
+@functools.lru_cache(maxsize=1)
+def _home_location():
+    return _get_env("HOME_LAT"), _get_env("HOME_LON")
+
+
+# Folder where credentials.json and token_*.json live (None if not configured)
+@functools.lru_cache(maxsize=1)
+def _secret_dir():
+    secret_dir = _get_env("AGENTPARK_SECRET_DIR")
+    return Path(secret_dir).expanduser() if secret_dir else None
 
 
 # Google API scopes
-GMAIL_SCOPES = ["https://www.googleapis.com/auth/gmail.readonly"]
-CAL_SCOPES = ["https://www.googleapis.com/auth/calendar.readonly"]
+# (tuples so they can be part of a cache key)
+GMAIL_SCOPES = ("https://www.googleapis.com/auth/gmail.readonly",)
+CAL_SCOPES = ("https://www.googleapis.com/auth/calendar.readonly",)
+
+
+@functools.lru_cache(maxsize=1)
+def _client():
+    """OpenAI client, created on first use (None if the key is missing)."""
+    api_key = _get_env("OpenAI_API_KEY")
+    # Bounded timeout so a stalled GPT call can't hold up the briefing for minutes
+    return OpenAI(api_key=api_key, timeout=30.0, max_retries=2) if api_key else None
+
+
+# Shared async HTTP client so NYT / OpenWeather connections are kept alive
+# (HTTP/2 where the server supports it) and many requests can be in flight
+# without tying up a thread each.
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+
+# Transient upstream failures are retried with exponential backoff
+# (0.2s, 0.4s, 0.8s) instead of failing the whole briefing. A Retry-After
+# header replaces the backoff, but waits longer than the cap aren't worth
+# holding the briefing for.
+HTTP_RETRIES = 3
+HTTP_BACKOFF_SECONDS = 0.2
+MAX_RETRY_AFTER_SECONDS = 10.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_http_client = None
+
+
+def get_http_client():
+    """Return the shared httpx.AsyncClient, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            # http2 / limits live on the transport when one is passed in.
+            # No transport-level retries: _get_with_retry is the only retry layer.
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            ),
+        )
+    return _http_client
+
+
+def _retry_after_seconds(resp):
+    """Seconds asked for by a Retry-After header (delta or HTTP date), or None."""
+    value = resp.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(resp, attempt):
+    """
+    How long to wait before retrying resp, or None if it shouldn't be retried.
+    A 429 without Retry-After isn't retried: NYT / OpenWeather limits are per
+    minute, so a sub-second backoff would only burn more quota.
+    """
+    if resp.status_code not in RETRY_STATUSES:
+        return None
+    retry_after = _retry_after_seconds(resp)
+    if retry_after is not None:
+        return retry_after if retry_after <= MAX_RETRY_AFTER_SECONDS else None
+    if resp.status_code == 429:
+        return None
+    return HTTP_BACKOFF_SECONDS * 2**attempt
 
-client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
 
+async def _get_with_retry(url, params):
+    """
+    GET through the shared client, retrying timeouts, dropped connections
+    and 429/5xx responses with backoff. Raises if the last attempt still fails.
+    """
+    client = get_http_client()
+    for attempt in range(HTTP_RETRIES + 1):
+        last_attempt = attempt == HTTP_RETRIES
+        try:
+            resp = await client.get(url, params=params)
+        except httpx.TransportError:
+            if last_attempt:
+                raise
+            delay = HTTP_BACKOFF_SECONDS * 2**attempt
+        else:
+            delay = None if last_attempt else _retry_delay(resp, attempt)
+            if delay is None:
+                resp.raise_for_status()
+                return resp
+        await asyncio.sleep(delay)
+
+
+async def close_http_client():
+    """Close the shared client (call on shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
+
+@functools.lru_cache(maxsize=4)
 def get_credentials(scopes, token_filename: str):
     """
     Handles Google OAuth flow for either Gmail or Calendar.
     Saves token to token_filename inside SECRET_DIR so you only log in once.
+    The result is memoized per process, so the token file is only read once;
+    google-auth refreshes the cached credentials in place when they expire.
     """
-    if not SECRET_DIR:
+    secret_dir = _secret_dir()
+    if not secret_dir:
         raise RuntimeError(
             "AGENTPARK_SECRET_DIR is not set. Add it to your .env file."
         )
 
     # Debug helpers – you can remove these once things work
-    print("SECRET_DIR is:", SECRET_DIR)
+    print("SECRET_DIR is:", secret_dir)
 
     # Build full path to the token file in the secrets folder
-    token_path = SECRET_DIR / token_filename
+    token_path = secret_dir / token_filename
     print("Using token file:", token_path, "Exists:", token_path.exists())
 
     creds = None
     if token_path.exists():
-        with open(token_path, "rb") as token_file:
-            creds = pickle.load(token_file)
+        creds = Credentials.from_authorized_user_file(str(token_path), scopes)
+    else:
+        # One-time migration from the old pickled token_*.pkl files
+        legacy_path = token_path.with_suffix(".pkl")
+        if legacy_path.exists():
+            with open(legacy_path, "rb") as token_file:
+                creds = pickle.load(token_file)
 
     # If there are no (valid) credentials, let user log in via browser
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
             creds.refresh(Request())
         else:
-            credentials_path = SECRET_DIR / "credentials.json"
+            credentials_path = secret_dir / "credentials.json"
             print(
                 "Using credentials file:",
                 credentials_path,
@@ -79,23 +222,78 @@ def get_credentials(scopes, token_filename: str):
             creds = flow.run_local_server(port=0)
 
         # Save the refreshed/new token back into the secrets folder
-        with open(token_path, "wb") as token_file:
-            pickle.dump(creds, token_file)
+        token_path.write_text(creds.to_json())
+    elif not token_path.exists():
+        # Still-valid legacy token: store it in the JSON format from now on
+        token_path.write_text(creds.to_json())
 
     return creds
 
 
+@functools.lru_cache(maxsize=None)
+def _get_service(api_name, api_version, scopes, token_filename):
+    """
+    Build a Google API client once per process and reuse it,
+    so discovery-doc parsing and credential loading only happen on the first call.
+    Returns (service, lock); use it through _use_service.
+    """
+    creds = get_credentials(scopes, token_filename)
+    # Use the discovery doc bundled with googleapiclient instead of fetching it
+    service = build(
+        api_name,
+        api_version,
+        credentials=creds,
+        cache_discovery=False,
+        static_discovery=True,
+    )
+    return service, threading.Lock()
+
+
+@contextlib.contextmanager
+def _use_service(api_name, api_version, scopes, token_filename):
+    """
+    Borrow a cached Google API client for one sequence of calls.
+    The client's httplib2.Http (and the token refresh it triggers) isn't
+    thread-safe, and the fetchers run in worker threads, so each cached
+    client is only used by one thread at a time.
+    """
+    service, lock = _get_service(api_name, api_version, scopes, token_filename)
+    with lock:
+        yield service
+
+
 # -------- NYT NEWS --------
-# Create OpenAI client (will be None if key missing)
+_WS_RE = re.compile(r"\s+")
+# Smart quotes and dashes -> plain ASCII, for comparing titles only
+_TITLE_PUNCT = str.maketrans({"‘": "'", "’": "'", "“": '"', "”": '"', "–": "-", "—": "-"})
+
+
+def _normalize_title(title):
+    """Collapse whitespace, punctuation variants and case so near-identical headlines compare equal."""
+    return _WS_RE.sub(" ", title.translate(_TITLE_PUNCT)).strip().casefold()
+
 
 def _expand_summary_with_gpt(title, abstract, url=None, target_sentences=7):
     """
     Use GPT to turn a short NYT abstract into a longer, 5–10 sentence overview.
     If anything goes wrong, just return the original abstract.
     """
-    if not client or not abstract:
+    if not _client() or not abstract:
         return abstract or "No summary available."
 
+    try:
+        return _gpt_overview(title, abstract, url, target_sentences)
+    except Exception:
+        # On any error, fall back to the original abstract
+        return abstract
+
+
+# Top stories stay on the front page for hours, so each background refresh
+# would otherwise pay for the same GPT expansions again. Keyed on the story
+# itself; failed calls (including empty completions) raise and are therefore
+# not cached.
+@functools.lru_cache(maxsize=64)
+def _gpt_overview(title, abstract, url, target_sentences):
     prompt = f"""
 You are preparing a spoken news briefing.
 
@@ -112,21 +310,57 @@ for a ~2-minute spoken summary. Requirements:
 - Avoid speculation and made-up details; stay grounded in the abstract.
 """
 
-    try:
-        resp = client.responses.create(
-            model="gpt-4.1-mini",
-            input=prompt,
-            max_output_tokens=500,
+    resp = _client().responses.create(
+        model="gpt-4.1-mini",
+        input=prompt,
+        max_output_tokens=500,
+    )
+    # Extract text from the response; adjust if your OpenAI client shape differs
+    long_text = resp.output[0].content[0].text.strip()
+    if not long_text:
+        raise ValueError(f"Empty GPT overview for {title!r}")
+    return long_text
+
+
+def _select_stories(stories, limit, seen_titles):
+    """
+    Single pass over raw NYT results: skip untitled and already-seen stories
+    and return up to `limit` {"title", "summary", "url"} dicts.
+    `seen_titles` holds normalized titles and is updated in place, so it can be
+    shared across several calls.
+    """
+    items = []
+
+    for s in stories:
+        if len(items) >= limit:
+            break
+
+        title = (s.get("title") or "").strip()
+        if not title:
+            continue
+
+        # Skip stories NYT lists more than once (e.g. under two sections)
+        title_key = _normalize_title(title)
+        if title_key in seen_titles:
+            continue
+        seen_titles.add(title_key)
+
+        # Fallback if abstract is empty
+        abstract = (s.get("abstract") or "").strip() or (s.get("snippet") or "").strip()
+
+        items.append(
+            {
+                "title": title,
+                "summary": abstract or "No summary available.",
+                # optional: include URL in case you want to link it in the voice/text
+                "url": s.get("url"),
+            }
         )
-        # Extract text from the response; adjust if your OpenAI client shape differs
-        long_text = resp.output[0].content[0].text.strip()
-        return long_text or abstract
-    except Exception:
-        # On any error, fall back to the original abstract
-        return abstract
+
+    return items
 
 
-def get_top_news(limit=5, detailed=False, target_sentences=7):
+async def get_top_news(limit=5, detailed=False, target_sentences=7):
     """
     Returns a list of dicts like:
     [
@@ -137,7 +371,8 @@ def get_top_news(limit=5, detailed=False, target_sentences=7):
     If detailed=True, 'summary' will be expanded into a 5–10 sentence overview
     using GPT (approx. 2-minute spoken summary).
     """
-    if not NYT_KEY:
+    nyt_key = _nyt_key()
+    if not nyt_key:
         return [
             {
                 "title": "(NYT API key missing)",
@@ -146,66 +381,61 @@ def get_top_news(limit=5, detailed=False, target_sentences=7):
         ]
 
     url = "https://api.nytimes.com/svc/topstories/v2/home.json"
-    resp = requests.get(url, params={"api-key": NYT_KEY})
-    resp.raise_for_status()
-    data = resp.json()
-
-    stories = data.get("results", [])[:limit]
-    items = []
-
-    for s in stories:
-        title = (s.get("title") or "").strip()
-        abstract = (s.get("abstract") or "").strip()
-
-        # Fallback if abstract is empty
-        if not abstract:
-            abstract = (s.get("snippet") or "").strip()
-
-        story_url = s.get("url")  # might be useful later
-
-        if not title:
-            continue
-
-        summary = abstract if abstract else "No summary available."
-
-        if detailed:
-            summary = _expand_summary_with_gpt(
-                title=title,
-                abstract=summary,
-                url=story_url,
-                target_sentences=target_sentences,
+    resp = await _get_with_retry(url, params={"api-key": nyt_key})
+    data = orjson.loads(resp.content)
+
+    items = _select_stories(data.get("results", []), limit, seen_titles=set())
+
+    if detailed and items:
+        # Each GPT call is an independent (blocking) network round trip, so run
+        # them side by side on a pool sized to the fan-out. The default executor
+        # is shared with the calendar / Gmail threads and can be smaller than this.
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=min(8, len(items)))
+        try:
+            summaries = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        executor,
+                        functools.partial(
+                            _expand_summary_with_gpt,
+                            title=item["title"],
+                            abstract=item["summary"],
+                            url=item["url"],
+                            target_sentences=target_sentences,
+                        ),
+                    )
+                    for item in items
+                )
             )
-
-        items.append(
-            {
-                "title": title,
-                "summary": summary,
-                # optional: include URL in case you want to link it in the voice/text
-                "url": story_url,
-            }
-        )
+        finally:
+            # Don't block the event loop joining the (by now idle) threads
+            executor.shutdown(wait=False)
+        for item, summary in zip(items, summaries):
+            item["summary"] = summary
 
     return items
 
 # -------- WEATHER --------
-def get_weather_summary():
-    if not WEATHER_KEY:
+async def get_weather_summary():
+    weather_key = _weather_key()
+    if not weather_key:
         return "(Weather API key missing – add WEATHER_API_KEY in .env)"
 
-    if not LAT or not LON:
+    lat, lon = _home_location()
+    if not lat or not lon:
         return "(Location missing – add HOME_LAT and HOME_LON in .env)"
 
     # Base URL only; all parameters go in 'params'
     url = "https://api.openweathermap.org/data/2.5/weather"
     params = {
-        "lat": LAT,
-        "lon": LON,
-        "appid": WEATHER_KEY,
+        "lat": lat,
+        "lon": lon,
+        "appid": weather_key,
         "units": "imperial",
     }
-    resp = requests.get(url, params=params)
-    resp.raise_for_status()
-    data = resp.json()
+    resp = await _get_with_retry(url, params=params)
+    data = orjson.loads(resp.content)
 
     desc = data["weather"][0]["description"]
     temp = round(data["main"]["temp"])
@@ -216,40 +446,55 @@ def get_weather_summary():
 
 
 # -------- CALENDAR --------
-def get_today_calendar_events():
+_EVENT_TIME_FORMAT = "%I:%M %p"
+
+
+@functools.lru_cache(maxsize=128)
+def _format_event_start(start_raw):
+    """
+    Display a Google Calendar start value as e.g. "9:00 AM".
+    Values that don't parse are shown as-is. Cached, since many events share start times.
+    """
+    # Neither dateTime nor date set – don't let one odd event sink the calendar
+    if not start_raw:
+        return "(no start time)"
+    # fromisoformat only accepts a trailing "Z" from Python 3.11 on
+    iso = start_raw[:-1] + "+00:00" if start_raw.endswith("Z") else start_raw
     try:
-        # token_calendar.pkl should live inside SECRET_DIR
-        creds = get_credentials(CAL_SCOPES, "token_calendar.pkl")
-        service = build("calendar", "v3", credentials=creds)
+        dt = datetime.fromisoformat(iso)
+    except ValueError:
+        return start_raw
+    return dt.strftime(_EVENT_TIME_FORMAT).lstrip("0")
+
 
+def get_today_calendar_events():
+    try:
         now = datetime.utcnow()
         end = now + timedelta(days=1)
 
         now_iso = now.isoformat() + "Z"
         end_iso = end.isoformat() + "Z"
 
-        events_result = (
-            service.events()
-            .list(
-                calendarId="primary",
-                timeMin=now_iso,
-                timeMax=end_iso,
-                singleEvents=True,
-                orderBy="startTime",
+        # token_calendar.json should live inside SECRET_DIR
+        with _use_service("calendar", "v3", CAL_SCOPES, "token_calendar.json") as service:
+            events_result = (
+                service.events()
+                .list(
+                    calendarId="primary",
+                    timeMin=now_iso,
+                    timeMax=end_iso,
+                    singleEvents=True,
+                    orderBy="startTime",
+                )
+                .execute()
             )
-            .execute()
-        )
         events = events_result.get("items", [])
 
         summaries = []
         for e in events:
             start_raw = e["start"].get("dateTime", e["start"].get("date"))
             # Try to display start time nicely
-            try:
-                dt = datetime.fromisoformat(start_raw.replace("Z", "+00:00"))
-                start_str = dt.strftime("%I:%M %p").lstrip("0")
-            except Exception:
-                start_str = start_raw
+            start_str = _format_event_start(start_raw)
 
             title = e.get("summary", "(no title)")
             summaries.append(f"{start_str}: {title}")
@@ -264,47 +509,97 @@ def get_today_calendar_events():
 
 
 # -------- GMAIL: PACKAGE EMAILS --------
-def get_recent_package_emails():
+def _header_value(headers, name, default):
+    """First value of the named header in a Gmail headers list, without building a dict."""
+    return next((h["value"] for h in headers if h["name"] == name), default)
+
+
+# Subject/sender of messages already fetched on earlier runs, keyed by
+# message id, so the next run only has to fetch messages it hasn't seen.
+SEEN_GMAIL_FILENAME = "seen_gmail_ids.json"
+
+
+def _load_seen_gmail(path):
+    try:
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def _save_seen_gmail(path, seen):
     try:
-        # token_gmail.pkl should live inside SECRET_DIR
-        creds = get_credentials(GMAIL_SCOPES, "token_gmail.pkl")
-        service = build("gmail", "v1", credentials=creds)
+        path.write_bytes(orjson.dumps(seen))
+    except OSError as e:
+        print("Gmail cache error:", e)
 
+
+def get_recent_package_emails():
+    try:
         # Look at last 7 days for shipping language
         query = 'newer_than:7d ("your order has shipped" OR "out for delivery" OR "order update")'
-        results = (
-            service.users()
-            .messages()
-            .list(userId="me", q=query, maxResults=10)
-            .execute()
-        )
+
+        # token_gmail.json should live inside SECRET_DIR
+        with _use_service("gmail", "v1", GMAIL_SCOPES, "token_gmail.json") as service:
+            results = (
+                service.users()
+                .messages()
+                .list(userId="me", q=query, maxResults=10)
+                .execute()
+            )
         messages = results.get("messages", [])
 
         if not messages:
             return []
 
-        package_summaries = []
-
+        seen_path = _secret_dir() / SEEN_GMAIL_FILENAME
+        seen = _load_seen_gmail(seen_path)
+        new_messages = [m for m in messages if m["id"] not in seen]
+
+        # Fetch the remaining message headers in one batched HTTP call
+        # instead of one round trip per message.
+        fetched = {}
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                print("Gmail error:", exception)
+                return
+            fetched[request_id] = response
+
+        if new_messages:
+            with _use_service("gmail", "v1", GMAIL_SCOPES, "token_gmail.json") as service:
+                batch = service.new_batch_http_request(callback=_collect)
+                for m in new_messages:
+                    batch.add(
+                        service.users()
+                        .messages()
+                        .get(
+                            userId="me",
+                            id=m["id"],
+                            format="metadata",
+                            metadataHeaders=["Subject", "From"],
+                        ),
+                        request_id=m["id"],
+                    )
+                batch.execute()
+
+        # Keep the order Gmail listed the messages in. Ids that fell out of
+        # the search window are dropped, so the cache file stays small.
+        current = {}
         for m in messages:
-            msg = (
-                service.users()
-                .messages()
-                .get(
-                    userId="me",
-                    id=m["id"],
-                    format="metadata",
-                    metadataHeaders=["Subject", "From"],
-                )
-                .execute()
-            )
-            headers = {
-                h["name"]: h["value"] for h in msg["payload"].get("headers", [])
-            }
-            subject = headers.get("Subject", "(no subject)")
-            sender = headers.get("From", "(unknown sender)")
-            package_summaries.append(f"{subject} from {sender}")
+            msg = fetched.get(m["id"])
+            if msg is not None:
+                headers = msg["payload"].get("headers", [])
+                current[m["id"]] = [
+                    _header_value(headers, "Subject", "(no subject)"),
+                    _header_value(headers, "From", "(unknown sender)"),
+                ]
+            elif m["id"] in seen:
+                current[m["id"]] = seen[m["id"]]
 
-        return package_summaries
+        if current != seen:
+            _save_seen_gmail(seen_path, current)
+
+        return [f"{subject} from {sender}" for subject, sender in current.values()]
 
     except Exception as e:
         # On Render (or if misconfigured), just log and return no packages
@@ -314,50 +609,59 @@ def get_recent_package_emails():
 
 
 # -------- BUILD MORNING SUMMARY --------
-def build_morning_summary():
-    today_str = datetime.now().strftime("%A, %B %d")
+def _or_fallback(result, label, fallback):
+    """
+    Unwrap a result from asyncio.gather(return_exceptions=True).
+    A failed source is logged and replaced so the rest of the briefing still goes out.
+    """
+    if isinstance(result, Exception):
+        print(f"{label} error:", result)
+        return fallback
+    return result
 
-    # Get data
-    weather = get_weather_summary()
-    # Ask for longer, ~2-minute style summaries
-    headlines = get_top_news(limit=7, detailed=True, target_sentences=8)
-    events = get_today_calendar_events()
-    packages = get_recent_package_emails()
 
-    parts = []
-    parts.append(f"Alrighty, here’s your rundown for {today_str}.")
+async def build_morning_summary():
+    today_str = datetime.now().strftime("%A, %B %d")
 
-    # Weather
-    parts.append(f"\nWeather: {weather}.")
+    # Get data – the sources are independent, so fetch them concurrently.
+    # The Google fetchers are blocking (googleapiclient), so those run
+    # in worker threads.
+    weather, headlines, events, packages = await asyncio.gather(
+        get_weather_summary(),
+        # Ask for longer, ~2-minute style summaries
+        get_top_news(limit=7, detailed=True, target_sentences=8),
+        asyncio.to_thread(get_today_calendar_events),
+        asyncio.to_thread(get_recent_package_emails),
+        return_exceptions=True,
+    )
+    weather = _or_fallback(weather, "Weather", "(weather is unavailable right now)")
+    headlines = _or_fallback(headlines, "News", [])
+    events = _or_fallback(events, "Calendar", [])
+    packages = _or_fallback(packages, "Gmail", [])
+
+    parts = [
+        f"Alrighty, here’s your rundown for {today_str}.",
+        # Weather
+        f"\nWeather: {weather}.",
+    ]
 
-    # News
+    # News – get_top_news already hands back stripped, non-empty title/summary
     if headlines:
         parts.append("\nHere are some top news stories you should know about:")
-
-    for item in headlines:
-        title = (item.get("title") or "").strip()
-        summary = (item.get("summary") or "").strip()
-
-        # Bullet with title
-        if title:
-            parts.append(f"\n• {title}")
-        # Indented multi-sentence overview under it
-        if summary:
-            parts.append(f"  {summary}")
+        # Bullet with title, indented multi-sentence overview under it
+        parts.extend(f"\n• {item['title']}\n  {item['summary']}" for item in headlines)
 
     # Calendar
     if events:
         parts.append("\nYour key events today:")
-        for e in events:
-            parts.append(f"• {e}")
+        parts.extend(f"• {e}" for e in events)
     else:
         parts.append("\nLooks like we have no events noted in the calendar today!")
 
     # Packages
     if packages:
         parts.append("\nRecent package updates:")
-        for p in packages:
-            parts.append(f"• {p}")
+        parts.extend(f"• {p}" for p in packages)
     else:
         parts.append(
             "\nYou don't have any new delivery updates you need to worry about right now."
@@ -366,6 +670,12 @@ def build_morning_summary():
     return "\n".join(parts)
 
 
+async def _main():
+    try:
+        print(await build_morning_summary())
+    finally:
+        await close_http_client()
+
+
 if __name__ == "__main__":
-    summary = build_morning_summary()
-    print(summary)
+    asyncio.run(_main())
@@ -1,16 +1,64 @@
+import asyncio
+import contextlib
+
 from fastapi import FastAPI
-from agentpark import build_morning_summary
+from agentpark import build_morning_summary, close_http_client, get_http_client
+
+# The briefing only needs to be minutes fresh, so it is rebuilt in the
+# background on this interval and served from memory.
+REFRESH_INTERVAL_SECONDS = 300
+
+_cached_summary = None
+_refresh_lock = asyncio.Lock()
+
+
+async def _refresh_summary():
+    """Rebuild the briefing and store it as the cached copy."""
+    global _cached_summary
+    async with _refresh_lock:
+        _cached_summary = await build_morning_summary()
+    return _cached_summary
+
+
+async def _refresher():
+    while True:
+        try:
+            await _refresh_summary()
+        except Exception as e:
+            # Keep serving the last good briefing and try again next round
+            print("Briefing refresh error:", e)
+        await asyncio.sleep(REFRESH_INTERVAL_SECONDS)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    get_http_client()
+    task = asyncio.create_task(_refresher())
+    yield
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+    await close_http_client()
+
 
-app = FastAPI()
+# Handlers declare their return type so FastAPI serializes the response
+# straight to JSON bytes through Pydantic instead of the stdlib json module.
+app = FastAPI(lifespan=lifespan)
 
 
 @app.get("/")
-def root():
+def root() -> dict[str, str]:
     """Simple health check endpoint."""
     return {"message": "Agent Park is running"}
 
 @app.get("/morning-briefing")
-def morning_summary():
+async def morning_summary() -> dict[str, str]:
     """Return the full morning summary as JSON."""
-    summary = build_morning_summary()
+    summary = _cached_summary
+    if summary is None:
+        # Cache still cold (first refresh not finished yet) – wait for it
+        async with _refresh_lock:
+            summary = _cached_summary
+        if summary is None:
+            summary = await _refresh_summary()
     return {"summary": summary}